@@ -1,11 +1,45 @@
 #!/usr/bin/env python3
 """Build script to generate sandbox.wasm from guest.py using componentize-py."""
 
+import inspect
 import subprocess
 import sys
 
-def main():
-    print("Building sandbox.wasm from guest.py...")
+# Keyword arguments for componentize-py's Python API as of 0.19.x
+COMPONENTIZE_KWARGS = {
+    "wit_path": ["sandbox.wit"],
+    "world": None,
+    "features": [],
+    "all_features": False,
+    "world_module": None,
+    "python_path": ["."],
+    "module_worlds": [],
+    "app_name": "guest",
+    "output_path": "sandbox.wasm",
+    "stub_wasi": True,
+    "import_interface_names": [],
+    "export_interface_names": [],
+}
+
+
+def load_componentize():
+    """Return componentize-py's in-process build function, or None if it
+    isn't installed or its signature differs from the one used here."""
+    try:
+        from componentize_py import componentize
+    except ImportError:
+        return None
+
+    try:
+        params = inspect.signature(componentize).parameters
+    except (TypeError, ValueError):
+        return None
+    if set(params) != set(COMPONENTIZE_KWARGS):
+        return None
+    return componentize
+
+
+def componentize_subprocess():
     cmd = [
         "componentize-py",
         "-d", "sandbox.wit",
@@ -15,9 +49,19 @@ def main():
         "-o", "sandbox.wasm"
     ]
 
-    result = subprocess.run(cmd, check=True)
+    subprocess.run(cmd, check=True)
+
+
+def main():
+    print("Building sandbox.wasm from guest.py...")
+    componentize = load_componentize()
+    if componentize is not None:
+        # Build in-process to avoid the cost of spawning the CLI
+        componentize(**COMPONENTIZE_KWARGS)
+    else:
+        componentize_subprocess()
     print("Successfully built sandbox.wasm")
     return 0
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main())
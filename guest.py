@@ -1,81 +1,139 @@
 import wit_world
 from componentize_py_types import Err
+import ast
+import builtins
+import functools
 import json
+from types import CodeType
 
 
-def handle(e: Exception) -> Err[str]:
+# Default separators are kept so that output matches `json.dumps`
+_dumps = json.JSONEncoder().encode
+
+_JSON_NULL = "null"
+_JSON_TRUE = "true"
+_JSON_FALSE = "false"
+_SMALL_INT_STRS = {i: str(i) for i in range(-256, 257)}
+
+
+def _to_json(value: object) -> str:
+    if value is None:
+        return _JSON_NULL
+    if value is True:
+        return _JSON_TRUE
+    if value is False:
+        return _JSON_FALSE
+    # Exact type check so int subclasses (e.g. enums) use the encoder
+    if type(value) is int and -256 <= value <= 256:
+        return _SMALL_INT_STRS[value]
+    return _dumps(value)
+
+
+@functools.lru_cache(maxsize=512)
+def _compile_eval(code: str) -> CodeType:
+    return compile(code, "<string>", "eval")
+
+
+@functools.lru_cache(maxsize=512)
+def _compile_exec(code: str) -> tuple[CodeType, CodeType | None]:
+    """Compile a block of statements, splitting off a trailing expression
+    so its value can be returned."""
+    try:
+        tree = ast.parse(code, "<string>", "exec")
+    except SyntaxError as e:
+        # `eval` of a string ignores surrounding whitespace, keep accepting
+        # a lone indented expression passed to exec
+        try:
+            expression = compile(code.strip(), "<string>", "eval")
+        except SyntaxError:
+            raise e from None
+        return compile("", "<string>", "exec"), expression
+
+    last = tree.body[-1] if tree.body else None
+    if not isinstance(last, ast.Expr):
+        return compile(tree, "<string>", "exec"), None
+
+    tree.body.pop()
+    program = compile(tree, "<string>", "exec")
+    expression = compile(ast.Expression(body=last.value), "<string>", "eval")
+    return program, expression
+
+
+def _err_msg(e: Exception) -> str:
+    name = type(e).__name__
     message = str(e)
-    if message == "":
-        return Err(f"{type(e).__name__}")
-    else:
-        return Err(f"{type(e).__name__}: {message}")
+    return name + ": " + message if message else name
 
 
 class WitWorld(wit_world.WitWorld):
+    def __init__(self) -> None:
+        super().__init__()
+        # Copied for every call so `__builtins__` is already present and
+        # writes to globals by user code don't carry over between calls
+        self._base_globals: dict[str, object] = {"__builtins__": builtins}
+        # Reused across calls rather than allocating a new dict for every
+        # call, cleared on exit so user objects aren't kept alive
+        self._locals: dict[str, object] = {}
+
     def eval(self, code: str) -> str:
         try:
-            program = compile(code, "<string>", "eval")
-            return json.dumps(eval(program))
+            local_vars = self._locals
+            return _to_json(eval(_compile_eval(code), self._base_globals.copy(), local_vars))
         except Exception as e:
-            raise handle(e)
+            raise Err(_err_msg(e)) from None
+        finally:
+            self._locals.clear()
 
-    def exec(self, code: str) -> None:
+    def eval_many(self, codes: list[str]) -> str:
+        """Evaluate a batch of expressions, returning their values as a
+        single JSON array."""
         try:
-            local_vars = {}
-
-            # Split into lines and filter empty ones, but keep track of indentation
-            all_lines = code.split('\n')
-
-            # Group lines into complete statements (handling multi-line blocks)
-            statements = []
-            i = 0
-            while i < len(all_lines):
-                line = all_lines[i]
-
-                # Skip empty lines
-                if not line.strip():
-                    i += 1
-                    continue
-
-                # Start of a new statement
-                current_stmt = [line]
-
-                # Check if this line ends with ':' (start of indented block)
-                if line.rstrip().endswith(':'):
-                    i += 1
-                    # Collect all indented lines that follow
-                    while i < len(all_lines):
-                        next_line = all_lines[i]
-                        if not next_line.strip():
-                            # Keep empty lines in the block
-                            current_stmt.append(next_line)
-                        elif next_line[0] == ' ' or next_line[0] == '\t':
-                            # Indented line - part of the block
-                            current_stmt.append(next_line)
-                        else:
-                            # Not indented - end of block
-                            break
-                        i += 1
-                else:
-                    i += 1
-
-                statements.append('\n'.join(current_stmt))
-
-            if not statements:
-                return json.dumps(None)
-
-            # Execute all but the last statement
-            for stmt in statements[:-1]:
-                exec(stmt, {}, local_vars)
-
-            # Try to evaluate last statement as expression
-            last_stmt = statements[-1]
-            try:
-                result = eval(last_stmt, {}, local_vars)
-            except SyntaxError:
-                exec(last_stmt, {}, local_vars)
-                result = None
-
-            return json.dumps(result)
+            g = self._base_globals.copy()
+            local_vars = self._locals
+            return _dumps([eval(_compile_eval(code), g, local_vars) for code in codes])
         except Exception as e:
-            raise handle(e)
+            raise Err(_err_msg(e)) from None
+        finally:
+            self._locals.clear()
+
+    def exec(self, code: str) -> str:
+        if not code or code.isspace():
+            return _JSON_NULL
+        try:
+            g = self._base_globals.copy()
+            local_vars = self._locals
+            program, expression = _compile_exec(code)
+
+            exec(program, g, local_vars)
+            if expression is None:
+                return _JSON_NULL
+
+            return _to_json(eval(expression, g, local_vars))
+        except Exception as e:
+            raise Err(_err_msg(e)) from None
+        finally:
+            self._locals.clear()
+
+
+# Common expressions compiled ahead of time by `_warmup`
+_WARMUP_EXPRESSIONS = ("0", "1", "True", "False", "None", "[]", "{}", '""')
+
+
+def _warmup() -> None:
+    """Run the eval and exec paths once at import time.
+
+    componentize-py snapshots the interpreter after importing this
+    module, so anything initialized here, including the compiled code
+    cache, is already done by the time the component is instantiated by
+    the host."""
+    # The host calls exec, so warm its cache as well as eval's
+    for expression in _WARMUP_EXPRESSIONS:
+        _compile_eval(expression)
+        _compile_exec(expression)
+
+    instance = WitWorld()
+    instance.eval("1")
+    instance.exec("x = 1\nx")
+
+
+_warmup()
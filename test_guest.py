@@ -39,36 +39,28 @@ sys.modules['wit_world'] = MockWitWorld
 sys.modules['componentize_py_types'] = MockComponentizePyTypes
 
 # Now import after mocking
-from guest import WitWorld, handle
+from guest import WitWorld, _err_msg
 Err = MockErr
 
 
-class TestHandleFunction:
-    """Tests for the handle function"""
+class TestErrMsgFunction:
+    """Tests for the _err_msg function"""
 
-    def test_handle_exception_with_message(self):
+    def test_err_msg_exception_with_message(self):
         e = ValueError("test error message")
-        result = handle(e)
-        assert isinstance(result, Err)
-        assert str(result) == "ValueError: test error message"
+        assert _err_msg(e) == "ValueError: test error message"
 
-    def test_handle_exception_without_message(self):
+    def test_err_msg_exception_without_message(self):
         e = ValueError("")
-        result = handle(e)
-        assert isinstance(result, Err)
-        assert str(result) == "ValueError"
+        assert _err_msg(e) == "ValueError"
 
-    def test_handle_syntax_error(self):
+    def test_err_msg_syntax_error(self):
         e = SyntaxError("invalid syntax")
-        result = handle(e)
-        assert isinstance(result, Err)
-        assert "SyntaxError" in str(result)
+        assert "SyntaxError" in _err_msg(e)
 
-    def test_handle_name_error(self):
+    def test_err_msg_name_error(self):
         e = NameError("name 'x' is not defined")
-        result = handle(e)
-        assert isinstance(result, Err)
-        assert "NameError: name 'x' is not defined" in str(result)
+        assert "NameError: name 'x' is not defined" in _err_msg(e)
 
 
 class TestWitWorldEval:
@@ -104,6 +96,17 @@ class TestWitWorldEval:
         result = instance.eval("True")
         assert json.loads(result) is True
 
+    def test_eval_false(self):
+        instance = WitWorld()
+        result = instance.eval("False")
+        assert result == "false"
+
+    def test_eval_small_and_large_ints(self):
+        instance = WitWorld()
+        assert instance.eval("-256") == "-256"
+        assert instance.eval("256") == "256"
+        assert instance.eval("10 ** 20") == "100000000000000000000"
+
     def test_eval_none(self):
         instance = WitWorld()
         result = instance.eval("None")
@@ -117,6 +120,14 @@ class TestWitWorldEval:
         except Err as e:
             assert "SyntaxError" in str(e)
 
+    def test_eval_empty_code(self):
+        instance = WitWorld()
+        try:
+            instance.eval("  \n")
+            assert False, "Should have raised an exception"
+        except Err as e:
+            assert "SyntaxError" in str(e)
+
     def test_eval_name_error(self):
         instance = WitWorld()
         try:
@@ -124,6 +135,8 @@ class TestWitWorldEval:
             assert False, "Should have raised an exception"
         except Err as e:
             assert "NameError" in str(e)
+            assert e.__cause__ is None
+            assert e.__suppress_context__
 
     def test_eval_type_error(self):
         instance = WitWorld()
@@ -133,6 +146,48 @@ class TestWitWorldEval:
         except Err as e:
             assert "ValueError" in str(e)
 
+    def test_eval_does_not_see_module_globals(self):
+        instance = WitWorld()
+        try:
+            instance.eval("json")
+            assert False, "Should have raised an exception"
+        except Err as e:
+            assert "NameError" in str(e)
+
+
+class TestWitWorldEvalMany:
+    """Tests for the WitWorld.eval_many method"""
+
+    def test_eval_many_returns_array(self):
+        instance = WitWorld()
+        result = instance.eval_many(["1 + 1", '"a"', "None", "1 + 1"])
+        assert json.loads(result) == [2, "a", None, 2]
+
+    def test_eval_many_empty(self):
+        instance = WitWorld()
+        result = instance.eval_many([])
+        assert json.loads(result) == []
+
+    def test_eval_many_empty_expression_matches_eval(self):
+        instance = WitWorld()
+        messages = []
+        for call in (lambda: instance.eval(""), lambda: instance.eval_many([""])):
+            try:
+                call()
+                assert False, "Should have raised an exception"
+            except Err as e:
+                messages.append(str(e))
+        assert messages[0] == messages[1]
+        assert "SyntaxError" in messages[0]
+
+    def test_eval_many_error(self):
+        instance = WitWorld()
+        try:
+            instance.eval_many(["1", "undefined_variable"])
+            assert False, "Should have raised an exception"
+        except Err as e:
+            assert "NameError" in str(e)
+
 
 class TestWitWorldExec:
     """Tests for the WitWorld.exec method"""
@@ -163,6 +218,19 @@ class TestWitWorldExec:
         # Assignment returns None, not the value
         assert json.loads(result) is None
 
+    def test_exec_indented_expression_after_blank_line(self):
+        instance = WitWorld()
+        result = instance.exec("\n  5 + 10")
+        assert json.loads(result) == 15
+
+    def test_exec_indented_first_statement(self):
+        instance = WitWorld()
+        try:
+            instance.exec("  x = 1\ny = 2\ny")
+            assert False, "Should have raised an exception"
+        except Err as e:
+            assert "IndentationError" in str(e)
+
     def test_exec_if_statement(self):
         instance = WitWorld()
         result = instance.exec("if True:\n    x = 10")
@@ -170,15 +238,14 @@ class TestWitWorldExec:
 
     def test_exec_if_else_statement(self):
         instance = WitWorld()
-        # Note: if/else with multiple colons is not properly handled
-        # by the statement parser - this test documents current behavior
-        try:
-            result = instance.exec("if False:\n    x = 10\nelse:\n    y = 20")
-            # If it somehow works, check for None
-            assert json.loads(result) is None
-        except Err as e:
-            # Expected to fail due to parsing limitation with multiple colons
-            assert "SyntaxError" in str(e)
+        result = instance.exec("if False:\n    x = 10\nelse:\n    y = 20")
+        assert json.loads(result) is None
+
+    def test_exec_if_elif_else_with_result(self):
+        instance = WitWorld()
+        code = "x = 2\nif x == 1:\n    y = 'one'\nelif x == 2:\n    y = 'two'\nelse:\n    y = 'other'\ny"
+        result = instance.exec(code)
+        assert json.loads(result) == "two"
 
     def test_exec_for_loop(self):
         instance = WitWorld()
@@ -225,6 +292,20 @@ class TestWitWorldExec:
         result = instance.exec("\n\n\n")
         assert json.loads(result) is None
 
+    def test_exec_only_whitespace(self):
+        instance = WitWorld()
+        result = instance.exec("  \t\n  ")
+        assert json.loads(result) is None
+
+    def test_exec_exception_with_unhashable_class(self):
+        instance = WitWorld()
+        code = "class M(type):\n    __hash__ = None\nclass E(Exception, metaclass=M):\n    pass\nraise E()"
+        try:
+            instance.exec(code)
+            assert False, "Should have raised an exception"
+        except Err as e:
+            assert str(e) == "E"
+
     def test_exec_syntax_error(self):
         instance = WitWorld()
         try:
@@ -278,17 +359,57 @@ evens
 
     def test_exec_try_except(self):
         instance = WitWorld()
-        # Note: try/except with multiple colons is not properly handled
-        # by the statement parser - this test documents current behavior
-        try:
-            result = instance.exec("try:\n    x\nexcept NameError:\n    y = 'caught'")
-            # If it somehow works, check for None
-            assert json.loads(result) is None
-        except Err as e:
-            # Expected to fail due to parsing limitation with multiple colons
-            assert "SyntaxError" in str(e)
+        result = instance.exec("try:\n    x\nexcept NameError:\n    y = 'caught'")
+        assert json.loads(result) is None
+
+    def test_exec_try_except_with_result(self):
+        instance = WitWorld()
+        result = instance.exec("try:\n    x\nexcept NameError:\n    y = 'caught'\ny")
+        assert json.loads(result) == "caught"
 
     def test_exec_with_tabs(self):
         instance = WitWorld()
         result = instance.exec("if True:\n\tx = 42")
-        assert json.loads(result) is None
\ No newline at end of file
+        assert json.loads(result) is None
+
+    def test_exec_expression_with_leading_whitespace(self):
+        instance = WitWorld()
+        result = instance.exec("  5   +   10  ")
+        assert json.loads(result) == 15
+
+    def test_exec_variables_do_not_persist_between_calls(self):
+        instance = WitWorld()
+        instance.exec("x = 5")
+        try:
+            instance.exec("x")
+            assert False, "Should have raised an exception"
+        except Err as e:
+            assert "NameError" in str(e)
+
+    def test_exec_globals_do_not_persist_between_calls(self):
+        instance = WitWorld()
+        instance.exec("global x\nx = 5")
+        try:
+            instance.exec("x")
+            assert False, "Should have raised an exception"
+        except Err as e:
+            assert "NameError" in str(e)
+
+    def test_exec_globals_dict_writes_do_not_leak_to_eval(self):
+        instance = WitWorld()
+        instance.exec("globals()['y'] = 3")
+        try:
+            instance.eval("y")
+            assert False, "Should have raised an exception"
+        except Err as e:
+            assert "NameError" in str(e)
+
+    def test_exec_clears_locals_on_exit(self):
+        instance = WitWorld()
+        instance.exec("big = list(range(1000))\nbig")
+        assert instance._locals == {}
+        try:
+            instance.exec("x = 1\nundefined_variable")
+        except Err:
+            pass
+        assert instance._locals == {}
\ No newline at end of file